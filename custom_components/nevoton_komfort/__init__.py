@@ -33,7 +33,12 @@ async def async_setup_entry(
     coordinator = NevotonKomfortCoordinator(hass, entry, api)
 
     # Fetch initial data and run coordinator setup hook.
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new client; don't leave its connection open.
+        await api.async_close()
+        raise
 
     # Store coordinator in entry runtime data
     entry.runtime_data = coordinator
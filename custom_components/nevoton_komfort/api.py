@@ -4,12 +4,17 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 import logging
+import re
 import socket
 from typing import Any
 from urllib.parse import urlencode, urlsplit
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    from json import loads as _json_loads
+
 from .const import (
     API_DEVICE_DESCRIPTION,
     API_GET_INPUTS,
@@ -28,6 +33,55 @@ _CONNECT_TIMEOUT = 5
 _READ_TIMEOUT = 10
 _WRITE_RESPONSE_TIMEOUT = 2
 _WRITE_RETRY_DELAY = 0.5
+_WRITE_BATCH_DELAY = 0.05
+_STATUS_PREFIX = b"HTTP/"
+
+_FRAMING_HEADER_RE = re.compile(
+    rb"^(content-length|transfer-encoding|connection):[ \t]*([^\r\n]*)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+type _Connection = tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+def _parse_headers(headers: bytes) -> tuple[int | None, bool, bool]:
+    """Return Content-Length, chunked and keep-alive flags from a header block.
+
+    Only the framing headers are picked out, in a single pass over the raw
+    bytes; repeated status lines from the controller are simply skipped.
+    """
+    content_length: int | None = None
+    chunked = False
+    keep_alive = True
+    for match in _FRAMING_HEADER_RE.finditer(headers):
+        name = match.group(1).lower()
+        value = match.group(2).strip().lower()
+        if name == b"content-length":
+            if value.isdigit():
+                content_length = int(value)
+        elif name == b"transfer-encoding":
+            chunked = b"chunked" in value
+        elif value == b"close":
+            keep_alive = False
+    return content_length, chunked, keep_alive
+
+
+async def _async_read_chunked_body(
+    reader: asyncio.StreamReader,
+    prefix: bytes = b"",
+) -> bytes:
+    """Read a chunked transfer-encoded body, discarding any trailers.
+
+    ``prefix`` holds bytes of the first chunk-size line already consumed.
+    """
+    body = bytearray()
+    line = prefix + await reader.readuntil(b"\r\n")
+    while size := int(line.split(b";", 1)[0], 16):
+        body.extend((await reader.readexactly(size + 2))[:-2])
+        line = await reader.readuntil(b"\r\n")
+    while await reader.readuntil(b"\r\n") != b"\r\n":
+        pass
+    return bytes(body)
 
 
 class NevotonApiError(Exception):
@@ -44,6 +98,9 @@ class NevotonApiError(Exception):
         super().__init__(message)
         self.error_api = error_api
         self.error_device = error_device
+        # Writes of a multi-parameter call the controller accepted before
+        # this error; set by async_set_parameters_pipelined.
+        self.acknowledged: tuple[tuple[str, int | float], ...] = ()
 
 
 class NevotonAuthError(NevotonApiError):
@@ -54,6 +111,15 @@ class NevotonConnectionError(NevotonApiError):
     """Connection error."""
 
 
+class _PartialPipelineError(NevotonConnectionError):
+    """The controller stopped answering part way through pipelined requests."""
+
+    def __init__(self, bodies: list[bytes]) -> None:
+        """Initialize with the responses that did arrive."""
+        super().__init__("Connection closed before all pipelined responses")
+        self.bodies = bodies
+
+
 class NevotonKomfortApi:
     """API client for Nevoton Komfort sauna controller.
 
@@ -61,6 +127,28 @@ class NevotonKomfortApi:
     which breaks standard HTTP clients. We use raw socket communication instead.
     """
 
+    __slots__ = (
+        "_base_url",
+        "_closed",
+        "_device_info",
+        "_device_url",
+        "_hash_suffix",
+        "_host",
+        "_host_header",
+        "_inflight",
+        "_password_hash",
+        "_pipelining_supported",
+        "_pool",
+        "_pool_lock",
+        "_port",
+        "_read_cache",
+        "_set_url_prefixes",
+        "_specific_urls",
+        "_write_batch",
+        "_write_batch_task",
+        "_writes_answered",
+    )
+
     def __init__(
         self,
         host: str,
@@ -73,7 +161,31 @@ class NevotonKomfortApi:
         self._host_header = parsed["host_header"]
         self._base_url = parsed["base_url"]
         self._password_hash = self._hash_password(password)
+        self._hash_suffix = f"&{PARAM_HASH}={self._password_hash}"
         self._device_info: dict[str, Any] | None = None
+        # Read requests never change, so their URLs are built once.
+        self._device_url = self._build_url(API_DEVICE_DESCRIPTION)
+        self._specific_urls = {
+            (endpoint, number): self._build_url(
+                endpoint,
+                {PARAM_TYPE: TYPE_SPECIFIC, PARAM_NUMBER: number},
+            )
+            for endpoint in (API_GET_INPUTS, API_GET_OUTPUTS)
+            for number in ("All", 0)
+        }
+        self._set_url_prefixes: dict[str, str] = {}
+        self._read_cache: dict[str, tuple[bytes, dict[str, Any]]] = {}
+        self._pool: asyncio.Queue[_Connection] = asyncio.Queue(maxsize=1)
+        self._pool_lock = asyncio.Lock()
+        self._closed = False
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._write_batch: list[
+            tuple[list[tuple[str, int | float]], asyncio.Future[None]]
+        ] = []
+        self._write_batch_task: asyncio.Task[None] | None = None
+        self._pipelining_supported = True
+        # None until a write shows whether this firmware answers writes.
+        self._writes_answered: bool | None = None
 
     @staticmethod
     def _parse_host(host: str) -> dict[str, Any]:
@@ -115,90 +227,85 @@ class NevotonKomfortApi:
         ).hexdigest()
 
     def _build_url(self, endpoint: str, params: dict[str, Any] | None = None) -> str:
-        """Build URL path with query parameters."""
-        query_params: dict[str, Any] = dict(params or {})
-        query_params[PARAM_HASH] = self._password_hash
-        query = urlencode(query_params)
-        return f"{endpoint}?{query}"
+        """Build URL path with query parameters and the password hash."""
+        if not params:
+            return f"{endpoint}?{PARAM_HASH}={self._password_hash}"
+        return f"{endpoint}?{urlencode(params)}{self._hash_suffix}"
+
+    def _build_set_url(self, parameter: str, value: int) -> str:
+        """Build a setOutputs URL path from a cached per-parameter prefix."""
+        if (prefix := self._set_url_prefixes.get(parameter)) is None:
+            query = urlencode(
+                {
+                    PARAM_TYPE: TYPE_SPECIFIC,
+                    PARAM_NUMBER: 0,
+                    PARAM_SP_NAME: parameter,
+                }
+            )
+            prefix = f"{API_SET_OUTPUTS}?{query}&{PARAM_VALUE}="
+            self._set_url_prefixes[parameter] = prefix
+        return f"{prefix}{value}{self._hash_suffix}"
+
+    def _build_request(self, url_path: str) -> bytes:
+        """Build the raw HTTP request for a URL path."""
+        return (
+            f"GET {url_path} HTTP/1.1\r\n"
+            f"Host: {self._host_header}\r\n"
+            f"Connection: keep-alive\r\n"
+            f"\r\n"
+        ).encode("ascii", errors="strict")
 
     async def _raw_request(
         self,
-        endpoint: str,
-        params: dict[str, Any] | None = None,
+        url_path: str,
         is_write: bool = False,
     ) -> dict[str, Any]:
         """Make raw HTTP request using sockets to handle buggy headers."""
-        url_path = self._build_url(endpoint, params)
-
-        request = (
-            f"GET {url_path} HTTP/1.0\r\n"
-            f"Host: {self._host_header}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
+        (body,) = await self._async_run_exchange(
+            self._build_request(url_path), is_write
         )
+        if is_write:
+            return self._parse_response(body, url_path, True)
 
-        def sync_request() -> str:
-            """Synchronous socket request with fresh connection each time."""
-            response = b""
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(_CONNECT_TIMEOUT)
-                sock.connect((self._host, self._port))
-                sock.sendall(request.encode("ascii", errors="strict"))
-
-                # Documented API returns JSON for writes, but some firmware builds
-                # complete the command without sending a response body.
-                if is_write:
-                    sock.settimeout(_WRITE_RESPONSE_TIMEOUT)
-                else:
-                    sock.settimeout(_READ_TIMEOUT)
-
-                while True:
-                    try:
-                        chunk = sock.recv(4096)
-                    except socket.timeout:
-                        if is_write:
-                            break
-                        raise
-
-                    if not chunk:
-                        break
-
-                    response += chunk
-                    if b"}" in response and response.strip().endswith(b"}"):
-                        break
-
-            return response.decode("utf-8", errors="replace")
-
-        try:
-            loop = asyncio.get_running_loop()
-            response_text = await loop.run_in_executor(None, sync_request)
-        except socket.timeout as err:
-            raise NevotonConnectionError("Connection timeout") from err
-        except OSError as err:
-            raise NevotonConnectionError(f"Connection error: {err}") from err
+        # Idle polls usually return byte-identical payloads; reuse the parse.
+        if (cached := self._read_cache.get(url_path)) and cached[0] == body:
+            return cached[1]
+        data = self._parse_response(body, url_path, False)
+        self._read_cache[url_path] = (body, data)
+        return data
 
-        if not response_text:
+    def _parse_response(
+        self,
+        body: bytes,
+        url_path: str,
+        is_write: bool,
+    ) -> dict[str, Any]:
+        """Decode a response body and raise on API or device errors."""
+        if not body:
             return {}
 
-        json_start = response_text.find("{")
+        json_start = body.find(b"{")
         if json_start == -1:
             if is_write:
                 _LOGGER.debug(
                     "No JSON body returned for write request to %s; assuming success",
-                    endpoint,
+                    url_path.partition("?")[0],
                 )
                 return {}
-            raise NevotonApiError(f"No JSON in response: {response_text[:200]}")
-
-        json_text = response_text[json_start:]
-        json_end = json_text.rfind("}")
-        if json_end != -1:
-            json_text = json_text[: json_end + 1]
+            raise NevotonApiError(
+                f"No JSON in response: {body[:200].decode('utf-8', errors='replace')}"
+            )
 
         try:
-            data = json.loads(json_text)
-        except json.JSONDecodeError as err:
-            raise NevotonApiError(f"Invalid JSON: {err}") from err
+            data = _json_loads(body[json_start:])
+        except ValueError as err:
+            try:
+                # Tolerate stray non-UTF-8 bytes the way the text decoder did.
+                data = _json_loads(
+                    body[json_start:].decode("utf-8", errors="replace")
+                )
+            except ValueError:
+                raise NevotonApiError(f"Invalid JSON: {err}") from err
 
         if not isinstance(data, dict):
             raise NevotonApiError(f"Unexpected JSON payload type: {type(data).__name__}")
@@ -220,16 +327,208 @@ class NevotonKomfortApi:
 
         return data
 
+    async def _async_run_exchange(
+        self,
+        request: bytes,
+        is_write: bool,
+        count: int = 1,
+    ) -> list[bytes]:
+        """Run an exchange, on the pooled connection if possible, mapping errors."""
+        try:
+            if is_write and not self._writes_answered:
+                # Until the firmware is known to answer writes, silence cannot
+                # tell a pooled connection from a half-open one. Send each
+                # write on its own connection, without holding polls up on
+                # the pool.
+                return await self._async_fresh_exchange(request, is_write, count)
+            async with self._pool_lock:
+                return await self._async_exchange(request, is_write, count)
+        except TimeoutError as err:
+            raise NevotonConnectionError("Connection timeout") from err
+        except OSError as err:
+            raise NevotonConnectionError(f"Connection error: {err}") from err
+
+    async def _async_exchange(
+        self,
+        request: bytes,
+        is_write: bool,
+        count: int,
+    ) -> list[bytes]:
+        """Send requests over a warm connection, reconnecting if it went stale."""
+        try:
+            connection: _Connection | None = self._pool.get_nowait()
+        except asyncio.QueueEmpty:
+            connection = None
+
+        if connection is not None:
+            try:
+                bodies = await self._async_send_on(
+                    connection, request, is_write, count, fresh=False
+                )
+            except (ConnectionError, TimeoutError):
+                # A half-open connection (controller rebooted, Wi-Fi dropped
+                # without a reset) swallows the request and times out.
+                bodies = None
+            if bodies is not None:
+                return bodies
+            # The controller dropped the idle connection; reconnect.
+
+        return await self._async_fresh_exchange(request, is_write, count)
+
+    async def _async_fresh_exchange(
+        self,
+        request: bytes,
+        is_write: bool,
+        count: int,
+    ) -> list[bytes]:
+        """Send requests over a newly opened connection."""
+        connection = await self._async_connect()
+        bodies = await self._async_send_on(
+            connection, request, is_write, count, fresh=True
+        )
+        if bodies is None:
+            if count > 1:
+                # Reached, but closed without answering the pipelined batch.
+                raise _PartialPipelineError([])
+            return [b""]
+        return bodies
+
+    async def _async_connect(self) -> _Connection:
+        """Open a new connection to the controller."""
+        async with asyncio.timeout(_CONNECT_TIMEOUT):
+            reader, writer = await asyncio.open_connection(self._host, self._port)
+        if (sock := writer.get_extra_info("socket")) is not None:
+            # Requests are tiny and always followed by a read, so never let
+            # Nagle hold them back; keepalive probes detect dead idle sockets.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        return reader, writer
+
+    async def _async_send_on(
+        self,
+        connection: _Connection,
+        request: bytes,
+        is_write: bool,
+        count: int,
+        *,
+        fresh: bool,
+    ) -> list[bytes] | None:
+        """Send requests on a connection, read one answer each and park it again.
+
+        Returns None if the peer closed the connection before answering.
+        """
+        reader, writer = connection
+        bodies: list[bytes] = []
+        reusable = True
+        try:
+            writer.write(request)
+            await writer.drain()
+            for _ in range(count):
+                if not reusable:
+                    raise _PartialPipelineError(bodies)
+                # Documented API returns JSON for writes, but some firmware
+                # builds complete the command without sending a response body.
+                # Silence only counts as success on a freshly opened
+                # connection; on a pooled one it may just be half-open.
+                try:
+                    async with asyncio.timeout(
+                        _WRITE_RESPONSE_TIMEOUT if is_write else _READ_TIMEOUT
+                    ):
+                        body, reusable = await self._async_read_response(reader)
+                except TimeoutError as err:
+                    if bodies:
+                        raise _PartialPipelineError(bodies) from err
+                    if not is_write or count > 1 or not fresh:
+                        raise
+                    body, reusable = b"", False
+                    self._writes_answered = False
+                except ConnectionError as err:
+                    if bodies:
+                        raise _PartialPipelineError(bodies) from err
+                    raise
+                else:
+                    if is_write and body is not None:
+                        self._writes_answered = True
+                if body is None:
+                    if bodies:
+                        raise _PartialPipelineError(bodies)
+                    writer.close()
+                    return None
+                bodies.append(body)
+        except BaseException:
+            writer.close()
+            raise
+
+        # A write sent outside the pool lock may have parked a connection
+        # meanwhile; the pool keeps only one, and none once closed.
+        if reusable and not self._closed and not self._pool.full():
+            self._pool.put_nowait(connection)
+        else:
+            writer.close()
+        return bodies
+
+    @staticmethod
+    async def _async_read_response(
+        reader: asyncio.StreamReader,
+    ) -> tuple[bytes | None, bool]:
+        """Read exactly one response body and whether the connection is reusable."""
+        try:
+            headers = await reader.readuntil(b"\r\n\r\n")
+            while True:
+                content_length, chunked, keep_alive = _parse_headers(headers)
+                # Some firmware repeats the whole status/header block, with
+                # or without framing headers; the last block frames the body.
+                # Look ahead byte by byte so a body shorter than the status
+                # prefix is never over-read.
+                lookahead = 5 if content_length is None else min(content_length, 5)
+                body = b""
+                while len(body) < lookahead and _STATUS_PREFIX.startswith(body):
+                    if not (byte := await reader.read(1)):
+                        break
+                    body += byte
+                if body != _STATUS_PREFIX:
+                    break
+                headers = body + await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError as err:
+            return (err.partial or None), False
+        except asyncio.LimitOverrunError as err:
+            raise NevotonConnectionError("Response header block too large") from err
+
+        if chunked:
+            try:
+                return await _async_read_chunked_body(reader, body), keep_alive
+            except (
+                asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError,
+                ValueError,
+            ):
+                return b"", False
+
+        if content_length is not None:
+            try:
+                body += await reader.readexactly(content_length - len(body))
+            except asyncio.IncompleteReadError as err:
+                return body + err.partial, False
+            return body, keep_alive
+
+        # No framing information: fall back to reading until the peer
+        # closes the connection or a complete JSON object has arrived.
+        buffer = bytearray(body)
+        while not buffer[-64:].rstrip().endswith(b"}"):
+            chunk = await reader.read(4096)
+            if not chunk:
+                break
+            buffer.extend(chunk)
+        return bytes(buffer), False
+
     async def _request(
         self,
-        endpoint: str,
-        params: dict[str, Any] | None = None,
+        url_path: str,
         is_write: bool = False,
     ) -> dict[str, Any]:
-        """Make API request."""
-        result = await self._raw_request(endpoint, params, is_write=is_write)
-
+        """Make API request for a URL path built by _build_url."""
         if is_write:
+            result = await self._raw_request(url_path, is_write=True)
             if not result:
                 _LOGGER.debug("Empty response for write operation (considered success)")
                 return {"success": True}
@@ -248,6 +547,15 @@ class NevotonKomfortApi:
 
             return result
 
+        # Identical reads already on the wire are shared instead of re-sent.
+        # The request runs as its own task so a cancelled caller does not
+        # abort it for the others.
+        if (task := self._inflight.get(url_path)) is None:
+            task = asyncio.create_task(self._raw_request(url_path))
+            self._inflight[url_path] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url_path, None))
+        result = await asyncio.shield(task)
+
         if not result:
             raise NevotonConnectionError("Empty response from device")
 
@@ -261,13 +569,7 @@ class NevotonKomfortApi:
         """Read and flatten all values from a specific channel type."""
         for number in ("All", 0):
             try:
-                data = await self._request(
-                    endpoint,
-                    {
-                        PARAM_TYPE: TYPE_SPECIFIC,
-                        PARAM_NUMBER: number,
-                    },
-                )
+                data = await self._request(self._specific_urls[endpoint, number])
             except NevotonApiError as err:
                 if number == "All" and err.error_api in {2, 3}:
                     _LOGGER.debug(
@@ -326,7 +628,7 @@ class NevotonKomfortApi:
 
     async def async_get_device_info(self) -> dict[str, Any]:
         """Get device information."""
-        data = await self._request(API_DEVICE_DESCRIPTION)
+        data = await self._request(self._device_url)
         self._device_info = data
         return data
 
@@ -347,20 +649,11 @@ class NevotonKomfortApi:
         value: int | float,
     ) -> bool:
         """Set a specific parameter."""
-        request_params = {
-            PARAM_TYPE: TYPE_SPECIFIC,
-            PARAM_NUMBER: 0,
-            PARAM_SP_NAME: parameter,
-            PARAM_VALUE: int(value),
-        }
+        url_path = self._build_set_url(parameter, int(value))
         data: dict[str, Any] = {}
         for attempt in range(2):
             try:
-                data = await self._request(
-                    API_SET_OUTPUTS,
-                    request_params,
-                    is_write=True,
-                )
+                data = await self._request(url_path, is_write=True)
                 break
             except NevotonConnectionError:
                 if attempt == 1:
@@ -371,6 +664,11 @@ class NevotonKomfortApi:
                 )
                 await asyncio.sleep(_WRITE_RETRY_DELAY)
 
+        return self._check_set_response(parameter, data)
+
+    @staticmethod
+    def _check_set_response(parameter: str, data: dict[str, Any]) -> bool:
+        """Raise if a setOutputs response reports a channel-level failure."""
         # Device may return transport-level success but channel-level failure.
         # Some firmware versions return empty or minimal response on success.
         if "outputs" not in data:
@@ -394,9 +692,113 @@ class NevotonKomfortApi:
             )
         return True
 
+    async def async_set_parameters_pipelined(
+        self,
+        pairs: list[tuple[str, int | float]],
+    ) -> bool:
+        """Set several parameters with their requests pipelined on one connection.
+
+        Only pipelines once the controller is known to answer writes. If it
+        answers only part of a pipelined batch, the unanswered writes are
+        sent sequentially and pipelining stays off from then on. On failure,
+        the raised error's ``acknowledged`` lists the pairs already written.
+        """
+        written = 0
+        try:
+            if len(pairs) > 1 and self._writes_answered and self._pipelining_supported:
+                url_paths = [
+                    self._build_set_url(parameter, int(value))
+                    for parameter, value in pairs
+                ]
+                try:
+                    bodies = await self._async_run_exchange(
+                        b"".join(
+                            self._build_request(url_path) for url_path in url_paths
+                        ),
+                        True,
+                        len(url_paths),
+                    )
+                except _PartialPipelineError as err:
+                    _LOGGER.debug(
+                        "Controller answered %d of %d pipelined writes, "
+                        "sending the rest sequentially",
+                        len(err.bodies),
+                        len(pairs),
+                    )
+                    self._pipelining_supported = False
+                    bodies = err.bodies
+                for (parameter, _), url_path, body in zip(pairs, url_paths, bodies):
+                    self._check_set_response(
+                        parameter, self._parse_response(body, url_path, True)
+                    )
+                    written += 1
+
+            for parameter, value in pairs[written:]:
+                await self.async_set_parameter(parameter, value)
+                written += 1
+        except NevotonApiError as err:
+            err.acknowledged = tuple(pairs[:written])
+            raise
+        return True
+
+    async def async_set_parameters_batch(
+        self,
+        pairs: list[tuple[str, int | float]],
+    ) -> bool:
+        """Set several parameters in order as part of a short write batch.
+
+        Writes queued by concurrent callers within the batch window are sent
+        back to back over the same connection, each caller's pairs pipelined.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._write_batch.append((pairs, future))
+        if self._write_batch_task is None:
+            self._write_batch_task = asyncio.create_task(
+                self._async_flush_write_batch()
+            )
+        await future
+        return True
+
+    async def _async_flush_write_batch(self) -> None:
+        """Send all writes queued during the batch window."""
+        batch = self._write_batch
+        try:
+            try:
+                await asyncio.sleep(_WRITE_BATCH_DELAY)
+            finally:
+                # Writes queued from here on start a new batch, even if this
+                # one was cancelled while waiting.
+                self._write_batch = []
+                self._write_batch_task = None
+
+            for pairs, future in batch:
+                if future.done():
+                    continue
+                try:
+                    await self.async_set_parameters_pipelined(pairs)
+                except Exception as err:  # noqa: BLE001 - forwarded to the caller
+                    # The caller may have been cancelled during its write.
+                    if not future.done():
+                        future.set_exception(err)
+                else:
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            for _, future in batch:
+                future.cancel()
+
     async def async_close(self) -> None:
         """Close the client and release resources."""
-        # No persistent connections to close.
+        self._closed = True
+        if self._write_batch_task is not None:
+            self._write_batch_task.cancel()
+        # Shared reads run as their own tasks and would otherwise finish
+        # after the pool has been emptied.
+        for task in list(self._inflight.values()):
+            task.cancel()
+        while not self._pool.empty():
+            _, writer = self._pool.get_nowait()
+            writer.close()
 
     @property
     def host(self) -> str:
@@ -18,7 +18,6 @@ from .api import NevotonApiError
 from .const import (
     PARAM_HEAT,
     PARAM_MAIN_POWER,
-    PARAM_TEMPERATURE_REAL,
     PARAM_TEMPERATURE_SET,
     TEMP_MAX,
     TEMP_MIN,
@@ -60,20 +59,18 @@ class NevotonKomfortClimate(NevotonKomfortEntity, ClimateEntity):
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
-        return self.coordinator.get_sensor_value(PARAM_TEMPERATURE_REAL)
+        return self.coordinator.state.temperature_real
 
     @property
     def target_temperature(self) -> float | None:
         """Return the target temperature."""
-        return self.coordinator.get_sensor_value(PARAM_TEMPERATURE_SET)
+        return self.coordinator.state.temperature_set
 
     @property
     def hvac_mode(self) -> HVACMode:
         """Return current HVAC mode."""
-        main_power = self.coordinator.get_switch_state(PARAM_MAIN_POWER)
-        heat_on = self.coordinator.get_switch_state(PARAM_HEAT)
-
-        if main_power and heat_on:
+        state = self.coordinator.state
+        if state.main_power and state.heat:
             return HVACMode.HEAT
         return HVACMode.OFF
 
@@ -81,26 +78,31 @@ class NevotonKomfortClimate(NevotonKomfortEntity, ClimateEntity):
         """Set HVAC mode."""
         if hvac_mode == HVACMode.HEAT:
             # Turn on main power and heater
-            await self.coordinator.async_set_parameter(PARAM_MAIN_POWER, 1)
-            self.coordinator.apply_local_update(PARAM_MAIN_POWER, 1)
             try:
-                await self.coordinator.async_set_parameter(PARAM_HEAT, 1)
-                self.coordinator.apply_local_update(PARAM_HEAT, 1)
-            except NevotonApiError:
-                # Rollback: turn off main power if heater activation failed
-                try:
-                    await self.coordinator.async_set_parameter(PARAM_MAIN_POWER, 0)
-                    self.coordinator.apply_local_update(PARAM_MAIN_POWER, 0)
-                except NevotonApiError:
-                    pass
+                await self.coordinator.async_set_parameters(
+                    [(PARAM_MAIN_POWER, 1), (PARAM_HEAT, 1)]
+                )
+            except NevotonApiError as err:
+                # Rollback: turn off main power if heater activation failed.
+                # Main power is written first, so it went through only if the
+                # controller acknowledged part of the batch; the coordinator
+                # has already applied that write locally.
+                if err.acknowledged:
+                    try:
+                        await self.coordinator.async_set_parameter(
+                            PARAM_MAIN_POWER, 0
+                        )
+                        self.coordinator.apply_local_update(PARAM_MAIN_POWER, 0)
+                    except NevotonApiError:
+                        pass
                 raise
+            self.coordinator.apply_local_update(PARAM_MAIN_POWER, 1)
+            self.coordinator.apply_local_update(PARAM_HEAT, 1)
         else:
             # Turn off heater (keep main power for other functions)
             await self.coordinator.async_set_parameter(PARAM_HEAT, 0)
             self.coordinator.apply_local_update(PARAM_HEAT, 0)
 
-        await self.coordinator.async_refresh_after_write()
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         if (temperature := kwargs.get(ATTR_TEMPERATURE)) is not None:
@@ -112,7 +114,6 @@ class NevotonKomfortClimate(NevotonKomfortEntity, ClimateEntity):
                 PARAM_TEMPERATURE_SET,
                 int(temperature),
             )
-            await self.coordinator.async_refresh_after_write()
 
     async def async_turn_on(self) -> None:
         """Turn on the sauna."""
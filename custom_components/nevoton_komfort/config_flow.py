@@ -66,6 +66,9 @@ class NevotonKomfortConfigFlow(ConfigFlow, domain=DOMAIN):
         except Exception:
             _LOGGER.exception("Unexpected exception during validation")
             errors["base"] = "unknown"
+        finally:
+            # The client keeps its connection open for reuse; release it.
+            await api.async_close()
 
         return None
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
 from datetime import timedelta
 import logging
 import re
@@ -20,11 +21,31 @@ from .api import (
     NevotonConnectionError,
     NevotonKomfortApi,
 )
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, PARAM_STATUS
+from .const import (
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    PARAM_FAN,
+    PARAM_HEAT,
+    PARAM_HUMIDITY,
+    PARAM_HUMIDITY_REAL,
+    PARAM_HUMIDITY_SET,
+    PARAM_LIGHT,
+    PARAM_LIGHT_DIMMER,
+    PARAM_MAIN_POWER,
+    PARAM_STATUS,
+    PARAM_TEMPERATURE_REAL,
+    PARAM_TEMPERATURE_SET,
+    PARAM_TIME_HEAT_REAL,
+    PARAM_TIME_HEAT_SET,
+    PARAM_TIMER_OFFSET_CHECKBOX,
+    PARAM_TIMER_OFFSET_REAL,
+    PARAM_TIMER_OFFSET_SET,
+)
 
 _LOGGER = logging.getLogger(__name__)
 _PARAMETER_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])|[^0-9A-Za-z]+")
 _PENDING_WRITE_HOLD_SECONDS = 15
+_DEBOUNCED_WRITE_DELAY = 0.15
 _TRANSIENT_FAILURE_TOLERANCE = 6
 
 
@@ -65,6 +86,31 @@ def _match_score(expected: str, candidate: str) -> int:
     return 20 + len(common_tokens)
 
 
+@dataclass(slots=True, frozen=True)
+class NevotonState:
+    """Typed snapshot of the controller values read by the entities."""
+
+    temperature_real: float | int | None = None
+    temperature_set: float | int | None = None
+    humidity_real: float | int | None = None
+    humidity_set: float | int | None = None
+    time_heat_real: int | None = None
+    time_heat_set: int | None = None
+    timer_offset_real: int | None = None
+    timer_offset_set: int | None = None
+    status: int | None = None
+    main_power: bool = False
+    heat: bool = False
+    fan: bool = False
+    steam_generator: bool = False
+    timer_offset: bool = False
+    light: bool = False
+    light_dimmer: int = -1
+
+
+_EMPTY_STATE = NevotonState()
+
+
 class NevotonKomfortCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage data updates from Nevoton Komfort device."""
 
@@ -83,6 +129,9 @@ class NevotonKomfortCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             name=DOMAIN,
             config_entry=config_entry,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            # Most polls of an idle sauna return identical data; only notify
+            # entities when something actually changed.
+            always_update=False,
         )
         self.api = api
         self._device_info: dict[str, Any] | None = None
@@ -90,8 +139,11 @@ class NevotonKomfortCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._logged_resolutions: set[tuple[str, str]] = set()
         self._logged_missing_parameters: set[str] = set()
         self._consecutive_update_failures = 0
-        self._post_write_refresh_task: asyncio.Task[None] | None = None
         self._pending_writes: dict[str, tuple[int, float]] = {}
+        self._debounced_values: dict[str, int] = {}
+        self._debounced_tasks: dict[str, asyncio.Task[None]] = {}
+        self._state = _EMPTY_STATE
+        self._state_source: dict[str, Any] | None = None
 
     async def _async_setup(self) -> None:
         """Set up the coordinator - fetch device info."""
@@ -218,6 +270,62 @@ class NevotonKomfortCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             value,
         )
 
+    async def async_set_parameters(
+        self,
+        pairs: list[tuple[str, int | float]],
+    ) -> bool:
+        """Resolve and write several controller parameters as one batch.
+
+        If the batch fails part way, the writes the controller did accept are
+        applied locally before the error is re-raised.
+        """
+        try:
+            return await self.api.async_set_parameters_batch(
+                [(self._resolve_parameter_name(key), value) for key, value in pairs]
+            )
+        except NevotonApiError as err:
+            for key, value in err.acknowledged:
+                self.apply_local_update(key, value)
+            raise
+
+    async def async_set_parameter_debounced(
+        self,
+        key: str,
+        value: int | float,
+        delay: float = _DEBOUNCED_WRITE_DELAY,
+    ) -> None:
+        """Write a parameter once per burst of calls, keeping only the last value.
+
+        Slider drags fire many writes in quick succession; every caller in a
+        burst waits for the single write of the final value, which is also
+        applied locally.
+        """
+        int_value = int(value)
+        if key not in self._debounced_values and self._get_value(key) == int_value:
+            return
+        self._debounced_values[key] = int_value
+        if (task := self._debounced_tasks.get(key)) is None:
+            task = self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_flush_debounced(key, delay),
+                f"{DOMAIN} debounced write {key}",
+            )
+            self._debounced_tasks[key] = task
+        await asyncio.shield(task)
+
+    async def _async_flush_debounced(self, key: str, delay: float) -> None:
+        """Write the last value collected for a parameter after the delay."""
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            # Later calls start a new burst instead of joining this write.
+            del self._debounced_tasks[key]
+            value = self._debounced_values.pop(key)
+        if self._get_value(key) == value:
+            return
+        await self.async_set_parameter(key, value)
+        self.apply_local_update(key, value)
+
     def apply_local_update(self, key: str, value: int | float) -> None:
         """Apply a successful write to the local coordinator cache."""
         resolved_key = self._resolve_parameter_name(key)
@@ -254,67 +362,66 @@ class NevotonKomfortCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return merged_state
 
-    async def async_refresh_after_write(self) -> None:
-        """Schedule a refresh after a write without blocking the service call."""
-        if self._post_write_refresh_task and not self._post_write_refresh_task.done():
-            self._post_write_refresh_task.cancel()
-
-        self._post_write_refresh_task = self.hass.async_create_task(
-            self._async_delayed_refresh_after_write()
-        )
-
-    async def _async_delayed_refresh_after_write(self) -> None:
-        """Run a delayed refresh after a write command."""
-        try:
-            await asyncio.sleep(1)
-            await self.async_request_refresh()
-        except asyncio.CancelledError:
-            raise
-        except Exception as err:  # noqa: BLE001 - keep entity writes non-fatal
-            _LOGGER.warning("Post-write refresh failed: %s", err)
-
-    async def async_shutdown(self) -> None:
-        """Cancel background work before unloading the integration."""
-        if self._post_write_refresh_task and not self._post_write_refresh_task.done():
-            self._post_write_refresh_task.cancel()
-            try:
-                await self._post_write_refresh_task
-            except asyncio.CancelledError:
-                pass
-            self._post_write_refresh_task = None
-
     @property
     def device_info(self) -> dict[str, Any] | None:
         """Return device info."""
         return self._device_info
 
+    @property
+    def state(self) -> NevotonState:
+        """Return the typed snapshot of the current data, built once per update."""
+        if self._state_source is not self.data:
+            self._state_source = self.data
+            self._state = self._build_state() if self.data else _EMPTY_STATE
+        return self._state
+
+    def _build_state(self) -> NevotonState:
+        """Digest the raw controller payload into a NevotonState."""
+        return NevotonState(
+            temperature_real=self.get_sensor_value(PARAM_TEMPERATURE_REAL),
+            temperature_set=self.get_sensor_value(PARAM_TEMPERATURE_SET),
+            humidity_real=self.get_sensor_value(PARAM_HUMIDITY_REAL),
+            humidity_set=self.get_sensor_value(PARAM_HUMIDITY_SET),
+            time_heat_real=self.get_timer_value(PARAM_TIME_HEAT_REAL),
+            time_heat_set=self.get_timer_value(PARAM_TIME_HEAT_SET),
+            timer_offset_real=self.get_timer_value(PARAM_TIMER_OFFSET_REAL),
+            timer_offset_set=self.get_timer_value(PARAM_TIMER_OFFSET_SET),
+            status=self.get_status(),
+            main_power=self.get_switch_state(PARAM_MAIN_POWER),
+            heat=self.get_switch_state(PARAM_HEAT),
+            fan=self.get_switch_state(PARAM_FAN),
+            steam_generator=self.get_switch_state(PARAM_HUMIDITY),
+            timer_offset=self.get_switch_state(PARAM_TIMER_OFFSET_CHECKBOX),
+            light=self.get_switch_state(PARAM_LIGHT),
+            light_dimmer=self.get_dimmer_value(PARAM_LIGHT_DIMMER),
+        )
+
+    def _get_value(self, key: str) -> Any:
+        """Return a live value, resolving the parameter name only on a miss."""
+        if not (data := self.data):
+            return None
+        if key in data:
+            return data[key]
+        return data.get(self._resolve_parameter_name(key))
+
     def get_switch_state(self, key: str) -> bool:
         """Get switch state from data."""
-        if not self.data:
-            return False
-        value = self.data.get(self._resolve_parameter_name(key))
-        return value == 1
+        return self._get_value(key) == 1
 
     def get_sensor_value(self, key: str) -> float | int | None:
         """Get sensor value from data."""
-        if self.data:
-            return self.data.get(self._resolve_parameter_name(key))
-        return None
+        return self._get_value(key)
 
     def get_timer_value(self, key: str) -> int | None:
         """Get timer value from data."""
-        if self.data:
-            return self.data.get(self._resolve_parameter_name(key))
-        return None
+        return self._get_value(key)
 
-    def get_dimmer_value(self, key: str) -> int | None:
-        """Get dimmer value from data."""
-        if self.data:
-            return self.data.get(self._resolve_parameter_name(key))
-        return None
+    def get_dimmer_value(self, key: str) -> int:
+        """Get dimmer value from data, or -1 when the controller has none."""
+        if (value := self._get_value(key)) is None:
+            return -1
+        return int(value)
 
     def get_status(self) -> int | None:
         """Get device status."""
-        if self.data:
-            return self.data.get(self._resolve_parameter_name(PARAM_STATUS))
-        return None
+        return self._get_value(PARAM_STATUS)
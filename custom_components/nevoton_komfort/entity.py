@@ -21,7 +21,6 @@ class NevotonKomfortEntity(CoordinatorEntity[NevotonKomfortCoordinator]):
     ) -> None:
         """Initialize the entity."""
         super().__init__(coordinator)
-        self._entity_key = entity_key
 
         # Set unique_id using device ID and entity key
         device_id = coordinator.api.device_id or "unknown"
@@ -9,7 +9,7 @@ from homeassistant.components.light import (
     ColorMode,
     LightEntity,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import NevotonKomfortConfigEntry
@@ -21,6 +21,20 @@ from .const import (
 from .coordinator import NevotonKomfortCoordinator
 from .entity import NevotonKomfortEntity
 
+# Convert the device's 0-6 dimmer scale to 0-255 and back with lookup tables,
+# using integer rounding on both sides.
+# Dimmer 0 still maps to a minimum visible level when the light switch is on.
+_DIMMER_TO_BRIGHTNESS = tuple(
+    (max(dimmer, 1) * 255 + LIGHT_DIMMER_MAX // 2) // LIGHT_DIMMER_MAX
+    for dimmer in range(LIGHT_DIMMER_MAX + 1)
+)
+# Brightness always maps to 1-6, since dimmer 0 means off on the device.
+_BRIGHTNESS_TO_DIMMER = bytes(
+    max(1, min(LIGHT_DIMMER_MAX, (brightness * LIGHT_DIMMER_MAX + 127) // 255))
+    for brightness in range(256)
+)
+_COLOR_MODES = frozenset((ColorMode.BRIGHTNESS,))
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,51 +51,64 @@ class NevotonKomfortLight(NevotonKomfortEntity, LightEntity):
 
     _attr_translation_key = "light"
     _attr_color_mode = ColorMode.BRIGHTNESS
-    _attr_supported_color_modes = {ColorMode.BRIGHTNESS}
+    _attr_supported_color_modes = _COLOR_MODES
 
     def __init__(self, coordinator: NevotonKomfortCoordinator) -> None:
         """Initialize the light entity."""
         super().__init__(coordinator, "light")
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if light is on."""
-        return self.coordinator.get_switch_state(PARAM_LIGHT)
-
-    @property
-    def brightness(self) -> int | None:
-        """Return the brightness of the light (0-255)."""
-        dimmer = self.coordinator.get_dimmer_value(PARAM_LIGHT_DIMMER)
-        if dimmer is None:
-            return None
-
-        # Convert 0-6 scale to 0-255.
-        # Dimmer 0 still maps to a minimum visible level when the light switch is on.
-        if dimmer <= 0:
-            return int(255 / LIGHT_DIMMER_MAX)
-        return int((min(dimmer, LIGHT_DIMMER_MAX) / LIGHT_DIMMER_MAX) * 255)
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        """Derive the light state from the latest coordinator data."""
+        state = self.coordinator.state
+        self._attr_is_on = state.light
+
+        dimmer = state.light_dimmer
+        self._attr_brightness = (
+            _DIMMER_TO_BRIGHTNESS[min(dimmer, LIGHT_DIMMER_MAX)]
+            if dimmer >= 0
+            else None
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
-        # First, turn on the light switch
-        await self.coordinator.async_set_parameter(PARAM_LIGHT, 1)
-        self.coordinator.apply_local_update(PARAM_LIGHT, 1)
-
-        # Then set brightness if provided
-        if ATTR_BRIGHTNESS in kwargs:
-            brightness = kwargs[ATTR_BRIGHTNESS]
-            # Convert 0-255 to 1-6 (0 means off on the device)
-            dimmer_value = max(
-                1,
-                min(LIGHT_DIMMER_MAX, round(brightness / 255 * LIGHT_DIMMER_MAX)),
-            )
-            await self.coordinator.async_set_parameter(PARAM_LIGHT_DIMMER, dimmer_value)
-            self.coordinator.apply_local_update(PARAM_LIGHT_DIMMER, dimmer_value)
-
-        await self.coordinator.async_refresh_after_write()
+        dimmer_value = (
+            _BRIGHTNESS_TO_DIMMER[kwargs[ATTR_BRIGHTNESS]]
+            if ATTR_BRIGHTNESS in kwargs
+            else None
+        )
+
+        state = self.coordinator.state
+        if state.light:
+            # Already on: only the dimmer can change. Brightness drags arrive
+            # in bursts, so the coordinator coalesces them into one write and
+            # skips it when the step already matches.
+            if dimmer_value is not None:
+                await self.coordinator.async_set_parameter_debounced(
+                    PARAM_LIGHT_DIMMER, dimmer_value
+                )
+            return
+
+        writes: list[tuple[str, int]] = [(PARAM_LIGHT, 1)]
+        if dimmer_value is not None and state.light_dimmer != dimmer_value:
+            writes.append((PARAM_LIGHT_DIMMER, dimmer_value))
+
+        if len(writes) == 1:
+            await self.coordinator.async_set_parameter(PARAM_LIGHT, 1)
+        else:
+            # Switch and dimmer go out as one pipelined batch, switch first,
+            # instead of two separate round trips.
+            await self.coordinator.async_set_parameters(writes)
+        for key, value in writes:
+            self.coordinator.apply_local_update(key, value)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         await self.coordinator.async_set_parameter(PARAM_LIGHT, 0)
         self.coordinator.apply_local_update(PARAM_LIGHT, 0)
-        await self.coordinator.async_refresh_after_write()
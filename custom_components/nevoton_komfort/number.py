@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -12,7 +12,7 @@ from homeassistant.components.number import (
     NumberMode,
 )
 from homeassistant.const import PERCENTAGE, UnitOfTime
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import NevotonKomfortConfigEntry
@@ -32,7 +32,7 @@ class NevotonNumberEntityDescription(NumberEntityDescription):
     """Describes Nevoton Komfort number entity."""
 
     api_param: str
-    value_fn: Callable[[NevotonKomfortCoordinator], float | None]
+    state_attr: str
 
 
 NUMBER_DESCRIPTIONS: tuple[NevotonNumberEntityDescription, ...] = (
@@ -46,7 +46,7 @@ NUMBER_DESCRIPTIONS: tuple[NevotonNumberEntityDescription, ...] = (
         native_step=1,
         mode=NumberMode.SLIDER,
         api_param=PARAM_HUMIDITY_SET,
-        value_fn=lambda coord: coord.get_sensor_value(PARAM_HUMIDITY_SET),
+        state_attr="humidity_set",
     ),
     NevotonNumberEntityDescription(
         key="heat_timer",
@@ -58,7 +58,7 @@ NUMBER_DESCRIPTIONS: tuple[NevotonNumberEntityDescription, ...] = (
         native_step=5,
         mode=NumberMode.BOX,
         api_param=PARAM_TIME_HEAT_SET,
-        value_fn=lambda coord: coord.get_timer_value(PARAM_TIME_HEAT_SET),
+        state_attr="time_heat_set",
     ),
     NevotonNumberEntityDescription(
         key="delayed_start_timer",
@@ -71,7 +71,7 @@ NUMBER_DESCRIPTIONS: tuple[NevotonNumberEntityDescription, ...] = (
         mode=NumberMode.BOX,
         icon="mdi:timer-sand",
         api_param=PARAM_TIMER_OFFSET_SET,
-        value_fn=lambda coord: coord.get_timer_value(PARAM_TIMER_OFFSET_SET),
+        state_attr="timer_offset_set",
     ),
 )
 
@@ -84,8 +84,10 @@ async def async_setup_entry(
     """Set up Nevoton Komfort number entities."""
     coordinator = entry.runtime_data
     async_add_entities(
-        NevotonKomfortNumber(coordinator, description)
-        for description in NUMBER_DESCRIPTIONS
+        [
+            NevotonKomfortNumber(coordinator, description)
+            for description in NUMBER_DESCRIPTIONS
+        ]
     )
 
 
@@ -102,20 +104,18 @@ class NevotonKomfortNumber(NevotonKomfortEntity, NumberEntity):
         """Initialize the number entity."""
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._param = description.api_param
+        self._value_fn = attrgetter(description.state_attr)
+        self._attr_native_value = self._value_fn(coordinator.state)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the current value."""
-        return self.entity_description.value_fn(self.coordinator)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self._value_fn(self.coordinator.state)
+        super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the value."""
-        await self.coordinator.async_set_parameter(
-            self.entity_description.api_param,
-            int(value),
-        )
-        self.coordinator.apply_local_update(
-            self.entity_description.api_param,
-            int(value),
-        )
-        await self.coordinator.async_refresh_after_write()
+        # Slider drags are coalesced into one write of the final value, which
+        # is skipped when it already matches the device.
+        await self.coordinator.async_set_parameter_debounced(self._param, int(value))
@@ -20,14 +20,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import NevotonKomfortConfigEntry
-from .const import (
-    PARAM_HUMIDITY_REAL,
-    PARAM_STATUS,
-    PARAM_TEMPERATURE_REAL,
-    PARAM_TIME_HEAT_REAL,
-    PARAM_TIMER_OFFSET_REAL,
-)
-from .coordinator import NevotonKomfortCoordinator
+from .coordinator import NevotonKomfortCoordinator, NevotonState
 from .entity import NevotonKomfortEntity
 
 
@@ -44,7 +37,7 @@ def _convert_minutes_to_time(value: int | None) -> str | None:
 class NevotonSensorEntityDescription(SensorEntityDescription):
     """Describes Nevoton Komfort sensor entity."""
 
-    value_fn: Callable[[NevotonKomfortCoordinator], float | int | str | None]
+    value_fn: Callable[[NevotonState], float | int | str | None]
 
 
 SENSOR_DESCRIPTIONS: tuple[NevotonSensorEntityDescription, ...] = (
@@ -54,7 +47,7 @@ SENSOR_DESCRIPTIONS: tuple[NevotonSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.TEMPERATURE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.CELSIUS,
-        value_fn=lambda coord: coord.get_sensor_value(PARAM_TEMPERATURE_REAL),
+        value_fn=lambda state: state.temperature_real,
     ),
     NevotonSensorEntityDescription(
         key="humidity",
@@ -62,7 +55,7 @@ SENSOR_DESCRIPTIONS: tuple[NevotonSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.HUMIDITY,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
-        value_fn=lambda coord: coord.get_sensor_value(PARAM_HUMIDITY_REAL),
+        value_fn=lambda state: state.humidity_real,
     ),
     NevotonSensorEntityDescription(
         key="heat_time_remaining",
@@ -70,21 +63,19 @@ SENSOR_DESCRIPTIONS: tuple[NevotonSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.DURATION,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTime.MINUTES,
-        value_fn=lambda coord: coord.get_timer_value(PARAM_TIME_HEAT_REAL),
+        value_fn=lambda state: state.time_heat_real,
     ),
     NevotonSensorEntityDescription(
         key="delayed_start_time",
         translation_key="delayed_start_time",
         icon="mdi:timer-outline",
-        value_fn=lambda coord: _convert_minutes_to_time(
-            coord.get_timer_value(PARAM_TIMER_OFFSET_REAL)
-        ),
+        value_fn=lambda state: _convert_minutes_to_time(state.timer_offset_real),
     ),
     NevotonSensorEntityDescription(
         key="status",
         translation_key="status",
         icon="mdi:information-outline",
-        value_fn=lambda coord: coord.get_status(),
+        value_fn=lambda state: state.status,
     ),
 )
 
@@ -97,8 +88,10 @@ async def async_setup_entry(
     """Set up Nevoton Komfort sensor entities."""
     coordinator = entry.runtime_data
     async_add_entities(
-        NevotonKomfortSensor(coordinator, description)
-        for description in SENSOR_DESCRIPTIONS
+        [
+            NevotonKomfortSensor(coordinator, description)
+            for description in SENSOR_DESCRIPTIONS
+        ]
     )
 
 
@@ -115,8 +108,9 @@ class NevotonKomfortSensor(NevotonKomfortEntity, SensorEntity):
         """Initialize the sensor entity."""
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._value_fn = description.value_fn
 
     @property
     def native_value(self) -> float | int | str | None:
         """Return the sensor value."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self._value_fn(self.coordinator.state)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -20,7 +21,7 @@ from .const import (
     PARAM_MAIN_POWER,
     PARAM_TIMER_OFFSET_CHECKBOX,
 )
-from .coordinator import NevotonKomfortCoordinator
+from .coordinator import NevotonKomfortCoordinator, NevotonState
 from .entity import NevotonKomfortEntity
 
 
@@ -29,6 +30,7 @@ class NevotonSwitchEntityDescription(SwitchEntityDescription):
     """Describes Nevoton Komfort switch entity."""
 
     api_param: str
+    value_fn: Callable[[NevotonState], bool]
 
 
 SWITCH_DESCRIPTIONS: tuple[NevotonSwitchEntityDescription, ...] = (
@@ -36,24 +38,28 @@ SWITCH_DESCRIPTIONS: tuple[NevotonSwitchEntityDescription, ...] = (
         key="main_power",
         translation_key="main_power",
         api_param=PARAM_MAIN_POWER,
+        value_fn=lambda state: state.main_power,
         device_class=SwitchDeviceClass.SWITCH,
     ),
     NevotonSwitchEntityDescription(
         key="fan",
         translation_key="fan",
         api_param=PARAM_FAN,
+        value_fn=lambda state: state.fan,
         device_class=SwitchDeviceClass.SWITCH,
     ),
     NevotonSwitchEntityDescription(
         key="humidity",
         translation_key="steam_generator",
         api_param=PARAM_HUMIDITY,
+        value_fn=lambda state: state.steam_generator,
         device_class=SwitchDeviceClass.SWITCH,
     ),
     NevotonSwitchEntityDescription(
         key="timer_offset",
         translation_key="delayed_start",
         api_param=PARAM_TIMER_OFFSET_CHECKBOX,
+        value_fn=lambda state: state.timer_offset,
         device_class=SwitchDeviceClass.SWITCH,
     ),
 )
@@ -67,8 +73,10 @@ async def async_setup_entry(
     """Set up Nevoton Komfort switch entities."""
     coordinator = entry.runtime_data
     async_add_entities(
-        NevotonKomfortSwitch(coordinator, description)
-        for description in SWITCH_DESCRIPTIONS
+        [
+            NevotonKomfortSwitch(coordinator, description)
+            for description in SWITCH_DESCRIPTIONS
+        ]
     )
 
 
@@ -85,24 +93,20 @@ class NevotonKomfortSwitch(NevotonKomfortEntity, SwitchEntity):
         """Initialize the switch entity."""
         super().__init__(coordinator, description.key)
         self.entity_description = description
+        self._param = description.api_param
+        self._value_fn = description.value_fn
 
     @property
     def is_on(self) -> bool:
         """Return true if switch is on."""
-        return self.coordinator.get_switch_state(self.entity_description.api_param)
+        return self._value_fn(self.coordinator.state)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the switch."""
-        await self.coordinator.async_set_parameter(
-            self.entity_description.api_param, 1
-        )
-        self.coordinator.apply_local_update(self.entity_description.api_param, 1)
-        await self.coordinator.async_refresh_after_write()
+        await self.coordinator.async_set_parameter(self._param, 1)
+        self.coordinator.apply_local_update(self._param, 1)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
-        await self.coordinator.async_set_parameter(
-            self.entity_description.api_param, 0
-        )
-        self.coordinator.apply_local_update(self.entity_description.api_param, 0)
-        await self.coordinator.async_refresh_after_write()
+        await self.coordinator.async_set_parameter(self._param, 0)
+        self.coordinator.apply_local_update(self._param, 0)